@@ -0,0 +1,127 @@
+"""
+AST Cache
+=========
+
+Shared parse cache for analyzer modules.
+
+Parsed modules are cached in-process in a bounded LRU keyed by
+(path, mtime_ns, size). There is deliberately no on-disk layer: unpickling an AST costs about
+as much as parsing the source again.
+
+Files can be pre-filtered by raw byte tokens: a file that contains
+none of the requested tokens is never parsed.
+
+The cache never changes analysis results.
+"""
+
+import ast
+import functools
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+
+# PyCF_OPTIMIZED_AST (Python 3.13+) applies the optimize level to the
+# returned tree; older interpreters just build the plain AST
+_COMPILE_FLAGS = ast.PyCF_ONLY_AST | getattr(ast, "PyCF_OPTIMIZED_AST", 0)
+
+# Byte markers required for any AST-based entrypoint evidence
+# (FastAPI app objects, __main__ guards)
+EVIDENCE_TOKENS: Tuple[bytes, ...] = (b"FastAPI", b"__main__")
+
+# Parsed trees kept in-process. Bounded so trees for edited files
+# (stale mtime/size keys) and other repos age out of long-running
+# servers; results are also memoized per repo by the orchestrator.
+AST_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=AST_CACHE_SIZE)
+def _parse(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+    tokens: Tuple[bytes, ...],
+) -> Optional[ast.Module]:
+    """
+    Parse a file once per (path, mtime, size, tokens).
+    PRIVATE helper. Callers MUST treat the returned tree as read-only.
+    """
+    try:
+        data = Path(path_str).read_bytes()
+    except OSError:
+        return None
+
+    # Cheap byte scan before the expensive parse
+    if tokens and not any(token in data for token in tokens):
+        return None
+
+    try:
+        return compile(
+            data,
+            path_str,
+            "exec",
+            flags=_COMPILE_FLAGS,
+            dont_inherit=True,
+            optimize=2,
+        )
+    except Exception:
+        return None
+
+
+def load_ast(
+    path: Path,
+    tokens: Tuple[bytes, ...] = (),
+) -> Optional[ast.Module]:
+    """
+    Load the parsed AST for a Python file.
+
+    Args:
+        path (Path): Python source file
+        tokens (Tuple[bytes, ...]): If given, only parse when the raw
+            source contains at least one of them
+
+    Returns:
+        ast.Module, or None if the file is missing, not valid Python,
+        or filtered out by tokens
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    return _parse(str(path), stat.st_mtime_ns, stat.st_size, tuple(tokens))
+
+
+def parse_python_files(
+    repo_path: Path,
+    files: Iterable[str],
+    tokens: Tuple[bytes, ...] = EVIDENCE_TOKENS,
+) -> Mapping[str, ast.Module]:
+    """
+    Parse every relevant Python file in a repository exactly once.
+
+    The result is sealed (read-only) so it can be shared by all
+    analyzer stages without copying or locking.
+
+    Args:
+        repo_path (Path): Repository root
+        files (Iterable[str]): Relative paths to consider, normally the
+            scanner's py_files (the tree is never walked again here)
+        tokens (Tuple[bytes, ...]): Byte pre-filter, see load_ast
+
+    Returns:
+        Mapping[str, ast.Module]: Relative path -> parsed module.
+        Files that cannot be parsed, or contain none of the tokens,
+        are omitted.
+    """
+    tokens = tuple(tokens)
+    parsed: Dict[str, ast.Module] = {}
+
+    for relative in files:
+        if not relative.endswith(".py"):
+            continue
+        tree = load_ast(repo_path / relative, tokens)
+        if tree is not None:
+            parsed[relative] = tree
+
+    return MappingProxyType(parsed)
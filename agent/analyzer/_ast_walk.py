@@ -0,0 +1,51 @@
+"""
+Module-Level AST Traversal
+==========================
+
+Entrypoint evidence (app objects, __main__ guards) only counts at
+module scope. This traversal yields module-level statements and never
+descends into function, class, or lambda bodies.
+"""
+
+import ast
+from typing import Iterator, List
+
+
+# ast.TryStar (except*) exists from Python 3.11
+_TRY_NODES = (ast.Try, getattr(ast, "TryStar", ast.Try))
+
+
+def _child_blocks(node: ast.stmt) -> List[List[ast.stmt]]:
+    """
+    Statement lists still executed at import time.
+    """
+    if isinstance(node, ast.If):
+        return [node.body, node.orelse]
+
+    if isinstance(node, (ast.With, ast.AsyncWith)):
+        return [node.body]
+
+    if isinstance(node, _TRY_NODES):
+        return (
+            [node.body]
+            + [handler.body for handler in node.handlers]
+            + [node.orelse, node.finalbody]
+        )
+
+    return []
+
+
+def _iter_block(body: List[ast.stmt]) -> Iterator[ast.stmt]:
+    for node in body:
+        yield node
+        for block in _child_blocks(node):
+            yield from _iter_block(block)
+
+
+def iter_module_level(tree: ast.Module) -> Iterator[ast.stmt]:
+    """
+    Yield module-level statements in source order.
+
+    Recurses only into If/Try/With blocks.
+    """
+    return _iter_block(tree.body)
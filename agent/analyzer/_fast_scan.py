@@ -0,0 +1,41 @@
+"""
+Import Token Scanner
+====================
+
+Finds which of a fixed set of top-level modules a Python source file
+imports, in a single pass over the raw bytes (one compiled
+alternation).
+"""
+
+import mmap
+import re
+from typing import Iterable, Set, Tuple, Union
+
+
+# Start of an import statement, anchored to a (multiline) line start
+_IMPORT_PREFIX = rb"^[ \t]*(?:import|from)[ \t]+"
+
+
+class ImportScanner:
+    """
+    Compiled matcher for `import X` / `from X` statements.
+    """
+
+    def __init__(self, modules: Iterable[bytes]) -> None:
+        self._modules: Tuple[bytes, ...] = tuple(modules)
+
+        self._regex = re.compile(
+            _IMPORT_PREFIX
+            + b"("
+            + b"|".join(re.escape(m) for m in self._modules)
+            + rb")\b",
+            re.MULTILINE,
+        )
+
+    def scan(self, data: Union[bytes, mmap.mmap]) -> Set[bytes]:
+        """
+        Return the set of modules imported by the given source.
+
+        Accepts bytes or any read-only buffer (e.g. an mmap).
+        """
+        return set(self._regex.findall(data))
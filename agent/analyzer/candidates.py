@@ -0,0 +1,23 @@
+"""
+Entrypoint Candidates
+=====================
+
+Shared helpers for the entrypoint candidates reported by the stack
+detector and consumed by the resolver and the clarification layer.
+"""
+
+from typing import Optional, Tuple
+
+
+def candidate_fields(candidate: object) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Normalize an entrypoint candidate to (file, variable).
+
+    Candidates are either plain file paths or
+    {"file": ..., "variable": ...} dicts.
+    """
+    if isinstance(candidate, dict):
+        return candidate.get("file"), candidate.get("variable")
+    if isinstance(candidate, str):
+        return candidate, None
+    return None, None
@@ -0,0 +1,57 @@
+"""
+Confidence Levels
+=================
+
+Ordered confidence levels shared by analyzers, policy and generators.
+
+Levels are integers internally (cheap comparisons, min() gives the
+weakest level) and are serialized to "low" / "medium" / "high" only
+at output boundaries.
+"""
+
+from enum import IntEnum
+from typing import Dict, Optional
+
+
+class Confidence(IntEnum):
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+
+_BY_LABEL: Dict[str, Confidence] = {str(level): level for level in Confidence}
+
+
+def as_confidence(value: object) -> Optional[Confidence]:
+    """
+    Accept a Confidence member or its serialized label.
+
+    Lets consumers take analyzer output either fresh from the analyzers
+    or round-tripped through to_labels() / JSON. Unknown values give None.
+    """
+    if isinstance(value, str):
+        return _BY_LABEL.get(value)
+    if isinstance(value, int):
+        try:
+            return Confidence(value)
+        except ValueError:
+            return None
+    return None
+
+
+def to_labels(value: object) -> object:
+    """
+    Recursively replace Confidence members with their string labels.
+
+    json.dumps would otherwise emit IntEnum members as bare integers.
+    """
+    if isinstance(value, Confidence):
+        return str(value)
+    if isinstance(value, dict):
+        return {k: to_labels(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_labels(v) for v in value]
+    return value
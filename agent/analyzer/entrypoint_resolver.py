@@ -12,27 +12,48 @@ Uses AST inspection to avoid false positives.
 
 import ast
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Mapping, Optional
 
+from agent.analyzer._ast_cache import load_ast
+from agent.analyzer._ast_walk import iter_module_level
+from agent.analyzer.candidates import candidate_fields
+from agent.analyzer.confidence import Confidence
 
-def _has_main_guard(file_path: Path) -> bool:
+
+# Files without this marker cannot contain a __main__ guard
+MAIN_GUARD_TOKEN = b"__main__"
+
+
+def _is_main_guard_test(test: ast.expr) -> bool:
+    """
+    Structural match for:
+        __name__ == "__main__"
+        "__main__" == __name__
+    """
+    match test:
+        case ast.Compare(
+            left=ast.Name(id="__name__"),
+            ops=[ast.Eq()],
+            comparators=[ast.Constant(value="__main__")],
+        ):
+            return True
+        case ast.Compare(
+            left=ast.Constant(value="__main__"),
+            ops=[ast.Eq()],
+            comparators=[ast.Name(id="__name__")],
+        ):
+            return True
+    return False
+
+
+def _has_main_guard(tree: ast.Module) -> bool:
     """
-    Detect:
+    Detect (module level only):
         if __name__ == "__main__":
     """
-    try:
-        tree = ast.parse(file_path.read_text())
-    except Exception:
-        return False
-
-    for node in ast.walk(tree):
-        if isinstance(node, ast.If):
-            try:
-                condition = ast.unparse(node.test)
-            except Exception:
-                continue
-            if '__name__ == "__main__"' in condition:
-                return True
+    for node in iter_module_level(tree):
+        if isinstance(node, ast.If) and _is_main_guard_test(node.test):
+            return True
     return False
 
 
@@ -41,42 +62,36 @@ def resolve_entrypoint(
     scan_data: Dict[str, object],
     framework_data: Dict[str, object],
     stack_data: Dict[str, object],
+    parsed_asts: Optional[Mapping[str, ast.Module]] = None,
 ) -> Dict[str, object]:
     """
     Resolve execution model and entrypoint.
+
+    Args:
+        parsed_asts (Mapping, optional): Pre-parsed modules shared
+            across analyzer stages. Parsed on demand if omitted.
     """
     result: Dict[str, object] = {
         "type": None,  # script | asgi_service | wsgi_service
         "command": None,
-        "confidence": "low",
+        "confidence": Confidence.LOW,
         "notes": [],
     }
 
     framework = framework_data.get("framework")
-
-    # 1. Script detection (STRICT)
     candidates = stack_data.get("entrypoint_candidates", [])
 
-    for candidate in candidates:
-        if isinstance(candidate, dict):
-            file = candidate.get("file")
-        else:
-            file = candidate
-
-        path = repo_path / file
-        if path.exists() and _has_main_guard(path):
-            result["type"] = "script"
-            result["command"] = ["python", file]
-            result["confidence"] = "high"
-            return result
-
-    # 2. FastAPI ASGI detection (PROOF-BASED)
+    # 1. FastAPI ASGI detection (PROOF-BASED)
+    # Checked before the __main__ guard: a FastAPI module that also
+    # calls uvicorn.run() under the guard would bind 127.0.0.1 when
+    # run as a script, so it is always served through uvicorn here.
     if framework == "fastapi":
         for candidate in candidates:
-            file = candidate["file"]
-            var = candidate["variable"]
+            file, var = candidate_fields(candidate)
+            if not file or not var:
+                continue
 
-            module_path = file.replace("/", ".").replace(".py", "")
+            module_path = file.removesuffix(".py").replace("/", ".")
             app_ref = f"{module_path}:{var}"
 
             result["type"] = "asgi_service"
@@ -88,7 +103,26 @@ def resolve_entrypoint(
                 "--port",
                 "8000",
             ]
-            result["confidence"] = "high"
+            result["confidence"] = Confidence.HIGH
+            return result
+
+    # 2. Script detection (STRICT)
+    # Only plain-path candidates: files that define an app object
+    # are never treated as scripts
+    for candidate in candidates:
+        file, var = candidate_fields(candidate)
+        if not file or var:
+            continue
+
+        if parsed_asts is not None:
+            tree = parsed_asts.get(file)
+        else:
+            tree = load_ast(repo_path / file, (MAIN_GUARD_TOKEN,))
+
+        if tree is not None and _has_main_guard(tree):
+            result["type"] = "script"
+            result["command"] = ["python", file]
+            result["confidence"] = Confidence.HIGH
             return result
 
     result["notes"].append("No resolvable execution entrypoint found.")
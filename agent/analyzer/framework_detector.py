@@ -11,8 +11,14 @@ This module is:
 - Conservative in conclusions
 """
 
+import mmap
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Sequence, Set, Tuple
+
+from agent.analyzer._fast_scan import ImportScanner
+from agent.analyzer.confidence import Confidence
+from agent.scanner.repo_scanner import file_indexes
 
 
 FRAMEWORK_IMPORTS = {
@@ -26,6 +32,31 @@ RUNTIME_IMPORTS = {
     "gunicorn": "gunicorn",
 }
 
+# import token -> (category, name), built once at import time
+_IMPORT_CATEGORIES: Dict[bytes, Tuple[str, str]] = {
+    **{
+        token.encode(): ("frameworks", name)
+        for name, token in FRAMEWORK_IMPORTS.items()
+    },
+    **{
+        token.encode(): ("runtimes", name)
+        for name, token in RUNTIME_IMPORTS.items()
+    },
+}
+
+# Single pass over the source for every framework/runtime import
+_IMPORT_SCANNER = ImportScanner(_IMPORT_CATEGORIES)
+
+# Files at least this large are scanned through a read-only mmap
+# instead of being copied into a bytes object
+MMAP_MIN_SIZE = 64 * 1024
+
+FRAMEWORK_INTERFACES = {
+    "fastapi": "ASGI",
+    "django": "ASGI/WSGI",
+    "flask": "WSGI",
+}
+
 DEFAULT_PORTS = {
     "fastapi": 8000,
     "flask": 5000,
@@ -33,34 +64,45 @@ DEFAULT_PORTS = {
 }
 
 
-def _scan_imports(repo_path: Path, files: List[str]) -> Dict[str, List[str]]:
+def _scan_file(path: Path) -> Set[bytes]:
+    """
+    Return import tokens found in a single file.
+    """
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size >= MMAP_MIN_SIZE:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _IMPORT_SCANNER.scan(mm)
+        return _IMPORT_SCANNER.scan(fh.read())
+
+
+def _scan_imports(repo_path: Path, py_files: Sequence[str]) -> Dict[str, Set[str]]:
     """
     Scan Python files for framework/runtime imports.
 
+    Stops early once more than one framework is seen: that outcome
+    is a refusal regardless of the remaining files.
+
     Returns:
-        Dict[str, List[str]]: Found imports by category
+        Dict[str, Set[str]]: Found imports by category
     """
-    found = {
-        "frameworks": [],
-        "runtimes": [],
+    found: Dict[str, Set[str]] = {
+        "frameworks": set(),
+        "runtimes": set(),
     }
 
-    for file in files:
-        if not file.endswith(".py"):
-            continue
-
+    for file in py_files:
         try:
-            content = (repo_path / file).read_text(errors="ignore")
-        except Exception:
+            tokens = _scan_file(repo_path / file)
+        except OSError:
+            # Unreadable file (removed, permissions): no evidence
             continue
 
-        for name, token in FRAMEWORK_IMPORTS.items():
-            if f"import {token}" in content or f"from {token}" in content:
-                found["frameworks"].append(name)
+        for token in tokens:
+            category, name = _IMPORT_CATEGORIES[token]
+            found[category].add(name)
 
-        for name, token in RUNTIME_IMPORTS.items():
-            if f"import {token}" in content or f"from {token}" in content:
-                found["runtimes"].append(name)
+        if len(found["frameworks"]) > 1:
+            break
 
     return found
 
@@ -81,14 +123,14 @@ def detect_framework(
     Returns:
         Dict[str, object]: Framework analysis
     """
-    files: List[str] = scan_data.get("files", [])
+    _, py_files = file_indexes(scan_data)
 
     result = {
         "framework": None,
         "interface": None,  # ASGI / WSGI
         "runtime_server": None,
         "default_port": None,
-        "confidence": "low",
+        "confidence": Confidence.LOW,
         "notes": [],
     }
 
@@ -96,22 +138,15 @@ def detect_framework(
         result["notes"].append("Not a Python project.")
         return result
 
-    imports = _scan_imports(repo_path, files)
+    imports = _scan_imports(repo_path, py_files)
 
     # Framework detection
-    detected_frameworks = list(set(imports["frameworks"]))
+    detected_frameworks = sorted(imports["frameworks"])
     if len(detected_frameworks) == 1:
         framework = detected_frameworks[0]
         result["framework"] = framework
-        result["confidence"] = "medium"
-
-        if framework == "fastapi":
-            result["interface"] = "ASGI"
-        elif framework == "django":
-            result["interface"] = "ASGI/WSGI"
-        elif framework == "flask":
-            result["interface"] = "WSGI"
-
+        result["confidence"] = Confidence.MEDIUM
+        result["interface"] = FRAMEWORK_INTERFACES.get(framework)
         result["default_port"] = DEFAULT_PORTS.get(framework)
 
     elif len(detected_frameworks) > 1:
@@ -124,11 +159,11 @@ def detect_framework(
         return result
 
     # Runtime server detection
-    detected_runtimes = list(set(imports["runtimes"]))
+    detected_runtimes = sorted(imports["runtimes"])
     if detected_runtimes:
         if len(detected_runtimes) == 1:
             result["runtime_server"] = detected_runtimes[0]
-            result["confidence"] = "high"
+            result["confidence"] = Confidence.HIGH
         else:
             result["notes"].append(
                 f"Multiple runtime servers detected: {detected_runtimes}."
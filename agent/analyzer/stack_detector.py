@@ -13,62 +13,66 @@ This module:
 
 import ast
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Mapping, Optional
 
+from agent.analyzer._ast_cache import parse_python_files
+from agent.analyzer._ast_walk import iter_module_level
+from agent.analyzer.confidence import Confidence
+from agent.scanner.repo_scanner import file_indexes
 
-PYTHON_DEP_FILES = {
+
+# Ordered by preference: the first match wins when several exist
+PYTHON_DEP_FILES = (
     "requirements.txt",
     "pyproject.toml",
-}
+)
+
+# Files without this marker cannot instantiate FastAPI
+FASTAPI_TOKEN = b"FastAPI"
 
 
-def _detect_fastapi_apps(repo_path: Path, files: List[str]) -> List[Dict[str, str]]:
+def _detect_fastapi_app(tree: ast.Module, file: str) -> Optional[Dict[str, str]]:
     """
-    Detect FastAPI app instantiations using AST.
+    Detect the first module-level FastAPI app instantiation in a module.
+
+    Stops at the first match; later statements are never visited.
 
     Returns:
-        List of dicts with keys: file, variable
+        Dict with keys: file, variable; or None
     """
-    apps: List[Dict[str, str]] = []
-
-    for file in files:
-        if not file.endswith(".py"):
-            continue
-
-        path = repo_path / file
-        try:
-            tree = ast.parse(path.read_text())
-        except Exception:
-            continue
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
-                func = node.value.func
-                if isinstance(func, ast.Name) and func.id == "FastAPI":
-                    for target in node.targets:
-                        if isinstance(target, ast.Name):
-                            apps.append(
-                                {
-                                    "file": file,
-                                    "variable": target.id,
-                                }
-                            )
-    return apps
+    for node in iter_module_level(tree):
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call):
+            func = node.value.func
+            if isinstance(func, ast.Name) and func.id == "FastAPI":
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        return {
+                            "file": file,
+                            "variable": target.id,
+                        }
+    return None
 
 
 def detect_python_stack(
     repo_path: Path,
     scan_data: Dict[str, object],
+    parsed_asts: Optional[Mapping[str, ast.Module]] = None,
 ) -> Dict[str, object]:
     """
     Detect Python backend characteristics.
+
+    Args:
+        repo_path (Path): Repository root
+        scan_data (Dict): Repository scan output
+        parsed_asts (Mapping, optional): Pre-parsed modules shared
+            across analyzer stages. Parsed on demand if omitted.
     """
-    files: List[str] = scan_data.get("files", [])
+    files_set, py_files = file_indexes(scan_data)
     extensions: Dict[str, int] = scan_data.get("file_extensions", {})
 
     result: Dict[str, object] = {
         "is_python_project": False,
-        "confidence": "low",
+        "confidence": Confidence.LOW,
         "dependency_management": None,
         "entrypoint_candidates": [],
         "notes": [],
@@ -80,22 +84,28 @@ def detect_python_stack(
         return result
 
     result["is_python_project"] = True
-    result["confidence"] = "medium"
+    result["confidence"] = Confidence.MEDIUM
 
     # 2. Detect dependency management
-    for dep_file in PYTHON_DEP_FILES:
-        if dep_file in files:
-            result["dependency_management"] = dep_file
-            result["confidence"] = "high"
-            break
+    dep_file = next((f for f in PYTHON_DEP_FILES if f in files_set), None)
 
-    if result["dependency_management"] is None:
+    if dep_file is not None:
+        result["dependency_management"] = dep_file
+        result["confidence"] = Confidence.HIGH
+    else:
         result["notes"].append(
             "No standard Python dependency file found (requirements.txt / pyproject.toml)."
         )
 
     # 3. Detect FastAPI app definitions (PROOF-BASED)
-    fastapi_apps = _detect_fastapi_apps(repo_path, files)
+    if parsed_asts is None:
+        parsed_asts = parse_python_files(repo_path, py_files, (FASTAPI_TOKEN,))
+
+    fastapi_apps: List[Dict[str, str]] = []
+    for file, tree in parsed_asts.items():
+        app = _detect_fastapi_app(tree, file)
+        if app is not None:
+            fastapi_apps.append(app)
 
     if fastapi_apps:
         # Prefer apps under app/
@@ -105,7 +115,7 @@ def detect_python_stack(
         )
 
         result["entrypoint_candidates"] = sorted_apps
-        result["confidence"] = "high"
+        result["confidence"] = Confidence.HIGH
     else:
         result["notes"].append("No FastAPI app instantiation found.")
 
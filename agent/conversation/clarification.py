@@ -13,6 +13,9 @@ This module:
 
 from typing import Dict, List
 
+from agent.analyzer.confidence import Confidence, as_confidence
+from agent.analyzer.candidates import candidate_fields
+
 
 def build_clarification_questions(
     analyzer_output: Dict[str, object],
@@ -32,14 +35,17 @@ def build_clarification_questions(
     entrypoint = analyzer_output.get("entrypoint", {})
 
     # Case 1: Entrypoint ambiguity
-    if entrypoint.get("confidence") != "high":
+    # Output may carry Confidence members or their string labels
+    if as_confidence(entrypoint.get("confidence")) != Confidence.HIGH:
         candidates = python_stack.get("entrypoint_candidates", [])
 
         if candidates:
+            # Candidates may be dicts or plain paths; only those naming
+            # both a file and an app variable are selectable
             options = [
-                f"{c['file']}:{c['variable']}"
-                for c in candidates
-                if "file" in c and "variable" in c
+                f"{file}:{variable}"
+                for file, variable in map(candidate_fields, candidates)
+                if file and variable
             ]
 
             if options:
@@ -10,12 +10,17 @@ Controls the flow of:
 This is the SINGLE authority for agent flow.
 """
 
+import copy
 import uuid
-from typing import Dict, List
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Tuple
 
 from agent.conversation.state import ConversationState
 from agent.conversation.clarification import build_clarification_questions
-from agent.scanner.repo_scanner import scan_repository
+from agent.scanner.repo_scanner import public_scan, scan_repository
+from agent.analyzer._ast_cache import parse_python_files
+from agent.analyzer.confidence import Confidence, to_labels
 from agent.analyzer.stack_detector import detect_python_stack
 from agent.analyzer.framework_detector import detect_framework
 from agent.analyzer.entrypoint_resolver import resolve_entrypoint
@@ -24,6 +29,53 @@ from agent.generator.types import GeneratorInput
 from agent.reviewer.dockerfile_reviewer import DockerfileReviewer
 
 
+ANALYSIS_CACHE_SIZE = 16
+
+# (repo_path, fingerprint) -> (stack, framework, entrypoint)
+_analysis_cache: "OrderedDict[Tuple[str, str], Tuple]" = OrderedDict()
+
+
+def _analyze_cached(
+    repo_path: Path,
+    scan_data: Dict[str, object],
+) -> Tuple[Dict[str, object], Dict[str, object], Dict[str, object]]:
+    """
+    Run the analyzer stages, memoized on the repository fingerprint.
+    PRIVATE helper. Returns copies so sessions never share state.
+    """
+    key = (str(repo_path), scan_data["fingerprint"])
+
+    cached = _analysis_cache.get(key)
+    if cached is not None:
+        _analysis_cache.move_to_end(key)
+        return copy.deepcopy(cached)
+
+    # Parse once, share (read-only) across all analyzer stages
+    parsed_asts = parse_python_files(repo_path, scan_data["py_files"])
+
+    stack = detect_python_stack(repo_path, scan_data, parsed_asts)
+
+    framework = detect_framework(
+        repo_path=repo_path,
+        scan_data=scan_data,
+        stack_data=stack,
+    )
+
+    entrypoint = resolve_entrypoint(
+        repo_path=repo_path,
+        scan_data=scan_data,
+        framework_data=framework,
+        stack_data=stack,
+        parsed_asts=parsed_asts,
+    )
+
+    result = (stack, framework, entrypoint)
+    _analysis_cache[key] = result
+    if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
+
+    return copy.deepcopy(result)
+
 
 class ConversationOrchestrator:
     """
@@ -33,6 +85,8 @@ class ConversationOrchestrator:
 
     def __init__(self) -> None:
         self.state = ConversationState(session_id=str(uuid.uuid4()))
+        # Kept across runs so unchanged Dockerfiles hit the review cache
+        self.reviewer = DockerfileReviewer()
 
     # -------------------------
     # Step 1: Input handling
@@ -49,25 +103,16 @@ class ConversationOrchestrator:
         if not self.state.repo_path:
             raise RuntimeError("Repository path not set")
 
-        scan_data = scan_repository(self.state.repo_path)
-
-        stack = detect_python_stack(self.state.repo_path, scan_data)
+        repo_path = Path(self.state.repo_path)
 
-        framework = detect_framework(
-            repo_path=self.state.repo_path,
-            scan_data=scan_data,
-            stack_data=stack,
-        )
+        scan_data = scan_repository(repo_path)
 
-        entrypoint = resolve_entrypoint(
-            repo_path=self.state.repo_path,
-            scan_data=scan_data,
-            framework_data=framework,
-            stack_data=stack,
-        )
+        # Unchanged repository -> reuse previous analysis
+        stack, framework, entrypoint = _analyze_cached(repo_path, scan_data)
 
         analyzer_output = {
-            "repository": scan_data,
+            # Indexes stay internal: state and callers get plain data
+            "repository": public_scan(scan_data),
             "python_stack": stack,
             "framework": framework,
             "entrypoint": entrypoint,
@@ -77,26 +122,27 @@ class ConversationOrchestrator:
         self.state.analysis_completed = True
 
         confidences = [
-            stack.get("confidence", "low"),
-            framework.get("confidence", "low"),
-            entrypoint.get("confidence", "low"),
+            stack.get("confidence", Confidence.LOW),
+            framework.get("confidence", Confidence.LOW),
+            entrypoint.get("confidence", Confidence.LOW),
         ]
 
         self.state.analysis_confidence = self._lowest_confidence(confidences)
 
-        return analyzer_output
+        # State keeps Confidence members for comparisons; callers get
+        # the serialized "low" / "medium" / "high" labels
+        return to_labels(analyzer_output)
 
     # -------------------------
     # Step 3: Confidence helper
     # -------------------------
 
-    def _lowest_confidence(self, values: List[str]) -> str:
+    def _lowest_confidence(self, values: List[Confidence]) -> Confidence:
         """
         Determine the lowest confidence level.
         PRIVATE helper.
         """
-        order = {"low": 0, "medium": 1, "high": 2}
-        return min(values, key=lambda v: order.get(v, 0))
+        return min(values)
 
     # -------------------------
     # Step 4: Flow decision
@@ -110,7 +156,7 @@ class ConversationOrchestrator:
         if not self.state.analysis_completed:
             return "NEEDS_ANALYSIS"
 
-        if self.state.analysis_confidence != "high":
+        if self.state.analysis_confidence != Confidence.HIGH:
             questions = build_clarification_questions(
                 self.state.analyzer_output or {}
             )
@@ -144,7 +190,7 @@ class ConversationOrchestrator:
         if pending_ids.issubset(answered_ids):
             self.state.pending_questions = []
             self.state.clarifications_required = False
-            self.state.analysis_confidence = "high"
+            self.state.analysis_confidence = Confidence.HIGH
 
     # -------------------------
     # Step 6: Generator execution
@@ -157,7 +203,7 @@ class ConversationOrchestrator:
         if not self.state.analysis_completed:
             raise RuntimeError("Analysis not completed")
 
-        if self.state.analysis_confidence != "high":
+        if self.state.analysis_confidence != Confidence.HIGH:
             raise RuntimeError("Generation not allowed due to low confidence")
 
         self.state.generation_requested = True
@@ -183,8 +229,8 @@ class ConversationOrchestrator:
 
         self.state.generator_result = {
             "dockerfile": result.dockerfile,
-            "confidence": result.confidence,
-            "warnings": result.warnings,
+            "confidence": str(result.confidence),
+            "warnings": list(result.warnings),
             "refused": result.refused,
             "refusal_reason": result.refusal_reason,
         }
@@ -197,8 +243,7 @@ class ConversationOrchestrator:
             }
 
         # ---------- Review ----------
-        reviewer = DockerfileReviewer()
-        review = reviewer.review(result.dockerfile)
+        review = self.reviewer.review(result.dockerfile)
 
         self.state.review_result = review
         self.state.generation_completed = True
@@ -213,6 +258,6 @@ class ConversationOrchestrator:
         return {
             "status": "generated",
             "dockerfile": result.dockerfile,
-            "confidence": result.confidence,
+            "confidence": self.state.generator_result["confidence"],
             "review": review,
         }
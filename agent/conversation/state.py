@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
+from agent.analyzer.confidence import Confidence
 
-@dataclass
+
+@dataclass(slots=True)
 class ConversationState:
     """
     Explicit, controlled memory for a single agent session.
@@ -13,7 +15,7 @@ class ConversationState:
 
     # Analysis
     analysis_completed: bool = False
-    analysis_confidence: Optional[str] = None
+    analysis_confidence: Optional[Confidence] = None
     analyzer_output: Optional[Dict[str, object]] = None
 
     # Clarification
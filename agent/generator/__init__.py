@@ -2,11 +2,12 @@
 
 from agent.generator.base_generator import BaseDockerfileGenerator
 from agent.generator.contract import DockerfileGenerator
-from agent.generator.types import GeneratorInput, GeneratorResult
+from agent.generator.types import GeneratorInput, GeneratorResult, SafetyDecision
 
 __all__ = [
     "BaseDockerfileGenerator",
     "DockerfileGenerator",
     "GeneratorInput",
     "GeneratorResult",
+    "SafetyDecision",
 ]
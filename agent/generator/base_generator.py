@@ -12,9 +12,10 @@ This class:
 - Acts as a stable foundation for LLM or rule-based generators
 """
 
+from agent.analyzer.confidence import Confidence
 from agent.generator.contract import DockerfileGenerator
 from agent.generator.types import GeneratorInput, GeneratorResult
-from agent.policy.generator_policy import evaluate_generation_safety
+from agent.policy.generator_policy import reasons_to_strings
 
 
 class BaseDockerfileGenerator(DockerfileGenerator):
@@ -30,36 +31,32 @@ class BaseDockerfileGenerator(DockerfileGenerator):
         """
         Deterministically check if generation is allowed.
         """
-        allowed, _ = evaluate_generation_safety(
-            analyzer_output=input.analyzer_output,
-            answered_questions=input.answered_questions,
-        )
+        allowed, _ = self._cached_eval(input)
         return allowed
 
     def generate(self, input: GeneratorInput) -> GeneratorResult:
         """
         Enforce safety policy and return refusal or placeholder.
         """
-        allowed, reasons = evaluate_generation_safety(
-            analyzer_output=input.analyzer_output,
-            answered_questions=input.answered_questions,
-        )
+        allowed, reasons_mask = self._cached_eval(input)
 
         if not allowed:
             return GeneratorResult(
                 dockerfile=None,
-                confidence="low",
-                warnings=[],
+                confidence=Confidence.LOW,
+                warnings=(),
                 refused=True,
-                refusal_reason="; ".join(reasons),
+                refusal_reason="; ".join(
+                    reasons_to_strings(reasons_mask, input.answered_questions)
+                ),
             )
 
         # Placeholder success (NO Dockerfile yet)
         return GeneratorResult(
             dockerfile=None,
-            confidence="high",
-            warnings=[
-                "Generation allowed, but no concrete generator is implemented yet."
-            ],
+            confidence=Confidence.HIGH,
+            warnings=(
+                "Generation allowed, but no concrete generator is implemented yet.",
+            ),
             refused=False,
         )
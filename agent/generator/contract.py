@@ -1,7 +1,10 @@
 # agent/generator/contract.py
 
 from abc import ABC, abstractmethod
-from agent.generator.types import GeneratorInput, GeneratorResult
+from typing import Optional
+
+from agent.generator.types import GeneratorInput, GeneratorResult, SafetyDecision
+from agent.policy.generator_policy import evaluate_generation_safety
 
 
 class DockerfileGenerator(ABC):
@@ -11,6 +14,10 @@ class DockerfileGenerator(ABC):
     Implementations MAY use LLMs, but this interface is LLM-agnostic.
     """
 
+    # Framework this generator targets, used by the registry for
+    # direct dispatch. None means "probe with can_generate()".
+    framework: Optional[str] = None
+
     @abstractmethod
     def can_generate(self, input: GeneratorInput) -> bool:
         """
@@ -30,3 +37,37 @@ class DockerfileGenerator(ABC):
         - Refuse if unsafe
         """
         raise NotImplementedError
+
+    def prime(self, input: GeneratorInput, decision: SafetyDecision) -> None:
+        """
+        Hand over a policy decision already computed for `input`
+        (e.g. by the registry), so this generator does not re-run it.
+
+        Only honoured for the very same input object.
+        """
+        self._last_eval = (input, decision)
+
+    def _cached_eval(self, input: GeneratorInput) -> SafetyDecision:
+        """
+        Evaluate generation safety once per input object.
+
+        Uses input.precomputed or a primed decision when present;
+        otherwise can_generate() and generate(), called back to back
+        on the same input, share a single evaluation.
+        PRIVATE helper.
+        """
+        if input.precomputed is not None:
+            return input.precomputed
+
+        last = getattr(self, "_last_eval", None)
+        if last is not None and last[0] is input:
+            return last[1]
+
+        decision = SafetyDecision(
+            *evaluate_generation_safety(
+                analyzer_output=input.analyzer_output,
+                answered_questions=input.answered_questions,
+            )
+        )
+        self._last_eval = (input, decision)
+        return decision
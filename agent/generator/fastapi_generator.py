@@ -11,11 +11,63 @@ Deterministic Dockerfile generator for FastAPI applications.
 - Enforces analyzer + policy outputs
 """
 
-from typing import List
+import functools
+import json
+from typing import Dict, List, NamedTuple, Tuple
 
+from agent.analyzer.confidence import Confidence
 from agent.generator.contract import DockerfileGenerator
 from agent.generator.types import GeneratorInput, GeneratorResult
-from agent.policy.generator_policy import evaluate_generation_safety
+from agent.policy.generator_policy import reasons_to_strings
+
+
+DOCKERFILE_TEMPLATE = """\
+FROM python:3.11-slim
+
+WORKDIR /app
+
+ENV PYTHONDONTWRITEBYTECODE=1
+ENV PYTHONUNBUFFERED=1
+
+COPY {dependency_file} .
+RUN pip install --no-cache-dir -r {dependency_file}
+
+COPY . .
+
+EXPOSE {port}
+
+CMD {cmd_json}"""
+
+
+class _Prep(NamedTuple):
+    """
+    Policy decision plus the analyzer sections the generator reads.
+    """
+
+    allowed: bool
+    reasons: int
+    framework: Dict[str, object]
+    entrypoint: Dict[str, object]
+    python_stack: Dict[str, object]
+
+
+@functools.lru_cache(maxsize=64)
+def _render_dockerfile(
+    dependency_file: str, command: Tuple[str, ...], port: int
+) -> str:
+    """
+    Render the Dockerfile template. Identical inputs recur across
+    retries and reviews, so finished Dockerfiles are memoized.
+
+    CMD uses exec form, which must be a JSON array: json.dumps escapes
+    quotes and backslashes in arguments.
+    """
+    cmd_json = json.dumps(command)
+    return DOCKERFILE_TEMPLATE.format(
+        dependency_file=dependency_file,
+        port=port,
+        cmd_json=cmd_json,
+    )
 
 
 class FastAPIDockerfileGenerator(DockerfileGenerator):
@@ -23,37 +75,34 @@ class FastAPIDockerfileGenerator(DockerfileGenerator):
     Production-grade Dockerfile generator for FastAPI apps.
     """
 
-    def can_generate(self, input: GeneratorInput) -> bool:
-        allowed, _ = evaluate_generation_safety(
-            analyzer_output=input.analyzer_output,
-            answered_questions=input.answered_questions,
-        )
+    framework = "fastapi"
 
-        framework = input.analyzer_output.get("framework", {})
+    def can_generate(self, input: GeneratorInput) -> bool:
+        prep = self._prepare(input)
+        framework = prep.framework
         return (
-            allowed
+            prep.allowed
             and framework.get("framework") == "fastapi"
             and framework.get("interface") == "ASGI"
         )
 
     def generate(self, input: GeneratorInput) -> GeneratorResult:
-        allowed, reasons = evaluate_generation_safety(
-            analyzer_output=input.analyzer_output,
-            answered_questions=input.answered_questions,
-        )
+        prep = self._prepare(input)
 
-        if not allowed:
+        if not prep.allowed:
             return GeneratorResult(
                 dockerfile=None,
-                confidence="low",
-                warnings=[],
+                confidence=Confidence.LOW,
+                warnings=(),
                 refused=True,
-                refusal_reason="; ".join(reasons),
+                refusal_reason="; ".join(
+                    reasons_to_strings(prep.reasons, input.answered_questions)
+                ),
             )
 
-        framework = input.analyzer_output.get("framework", {})
-        entrypoint = input.analyzer_output.get("entrypoint", {})
-        python_stack = input.analyzer_output.get("python_stack", {})
+        framework = prep.framework
+        entrypoint = prep.entrypoint
+        python_stack = prep.python_stack
 
         if framework.get("framework") != "fastapi":
             return self._refuse("Not a FastAPI project")
@@ -77,8 +126,8 @@ class FastAPIDockerfileGenerator(DockerfileGenerator):
 
         return GeneratorResult(
             dockerfile=dockerfile,
-            confidence="high",
-            warnings=[],
+            confidence=Confidence.HIGH,
+            warnings=(),
             refused=False,
         )
 
@@ -86,37 +135,42 @@ class FastAPIDockerfileGenerator(DockerfileGenerator):
     # Internal helpers
     # -------------------------
 
+    def _prepare(self, input: GeneratorInput) -> _Prep:
+        """
+        Evaluate policy and look up analyzer sections once per input.
+
+        can_generate() and generate() run back to back on the same
+        input object; the second call reuses the first result.
+        """
+        last = getattr(self, "_last_prep", None)
+        if last is not None and last[0] is input:
+            return last[1]
+
+        allowed, reasons = self._cached_eval(input)
+        output = input.analyzer_output
+        prep = _Prep(
+            allowed=allowed,
+            reasons=reasons,
+            framework=output.get("framework", {}),
+            entrypoint=output.get("entrypoint", {}),
+            python_stack=output.get("python_stack", {}),
+        )
+        self._last_prep = (input, prep)
+        return prep
+
     def _build_dockerfile(
         self, dependency_file: str, command: List[str], port: int
     ) -> str:
         """
         Build deterministic FastAPI Dockerfile.
         """
-        cmd_json = ", ".join(f'"{c}"' for c in command)
-
-        return f"""
-FROM python:3.11-slim
-
-WORKDIR /app
-
-ENV PYTHONDONTWRITEBYTECODE=1
-ENV PYTHONUNBUFFERED=1
-
-COPY {dependency_file} .
-RUN pip install --no-cache-dir -r {dependency_file}
-
-COPY . .
-
-EXPOSE {port}
-
-CMD [{cmd_json}]
-""".strip()
+        return _render_dockerfile(dependency_file, tuple(command), port)
 
     def _refuse(self, reason: str) -> GeneratorResult:
         return GeneratorResult(
             dockerfile=None,
-            confidence="low",
-            warnings=[],
+            confidence=Confidence.LOW,
+            warnings=(),
             refused=True,
             refusal_reason=reason,
         )
@@ -10,11 +10,12 @@ based on analyzer output.
 No orchestration. No LLM. No side effects.
 """
 
-from typing import List, Optional
+from typing import Dict, Optional, Tuple
 
 from agent.generator.contract import DockerfileGenerator
 from agent.generator.fastapi_generator import FastAPIDockerfileGenerator
-from agent.generator.types import GeneratorInput
+from agent.generator.types import GeneratorInput, SafetyDecision
+from agent.policy.generator_policy import evaluate_generation_safety
 
 
 class GeneratorRegistry:
@@ -23,15 +24,65 @@ class GeneratorRegistry:
     """
 
     def __init__(self) -> None:
-        self._generators: List[DockerfileGenerator] = [
+        self._generators: Tuple[DockerfileGenerator, ...] = (
             FastAPIDockerfileGenerator(),
-        ]
+        )
+        self._reindex()
+
+    def register(self, generator: DockerfileGenerator) -> None:
+        """
+        Add a generator.
+        """
+        self._generators += (generator,)
+        self._reindex()
 
     def select(self, input: GeneratorInput) -> Optional[DockerfileGenerator]:
         """
         Select the first generator that can handle the input.
+
+        Every generator requires the safety policy to pass, so it is
+        checked once up front and handed to each probed generator;
+        the selected generator's generate() reuses it for this input.
+        The framework's generator is found by key; generators without
+        a framework are probed in order.
         """
-        for generator in self._generators:
+        decision = input.precomputed
+        if decision is None:
+            decision = SafetyDecision(
+                *evaluate_generation_safety(
+                    analyzer_output=input.analyzer_output,
+                    answered_questions=input.answered_questions,
+                )
+            )
+        if not decision.allowed:
+            return None
+
+        framework = input.analyzer_output.get("framework", {}).get("framework")
+        candidates = self._untargeted
+        generator = self._by_framework.get(framework)
+        if generator is not None:
+            candidates = (generator,) + candidates
+
+        for generator in candidates:
+            generator.prime(input, decision)
             if generator.can_generate(input):
                 return generator
         return None
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    def _reindex(self) -> None:
+        """
+        Rebuild the framework dispatch table. The first generator
+        registered for a framework wins, as with a linear scan.
+        """
+        self._by_framework: Dict[str, DockerfileGenerator] = {}
+        self._untargeted: Tuple[DockerfileGenerator, ...] = ()
+
+        for generator in self._generators:
+            if generator.framework is None:
+                self._untargeted += (generator,)
+            else:
+                self._by_framework.setdefault(generator.framework, generator)
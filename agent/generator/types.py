@@ -1,27 +1,47 @@
 # agent/generator/types.py
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Mapping, NamedTuple, Optional, Tuple
 
+from agent.analyzer.confidence import Confidence
 
-@dataclass
+
+class SafetyDecision(NamedTuple):
+    """
+    Outcome of the generation safety policy.
+
+    reasons is the policy's reason bitmask (0 when allowed).
+    """
+
+    allowed: bool
+    reasons: int
+
+
+@dataclass(slots=True, frozen=True)
 class GeneratorInput:
     """
     Immutable input provided to the Dockerfile generator.
+
+    Mapping fields are read-only by contract, so callers may pass
+    MappingProxyType views instead of copies.
+
+    A caller that already evaluated the safety policy for this exact
+    input may pass it as `precomputed`; generators then skip it.
     """
 
-    analyzer_output: Dict[str, object]
-    answered_questions: Dict[str, str]
+    analyzer_output: Mapping[str, object]
+    answered_questions: Mapping[str, str]
+    precomputed: Optional[SafetyDecision] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GeneratorResult:
     """
     Result returned by a generator attempt.
     """
 
     dockerfile: Optional[str]
-    confidence: str                 # low | medium | high
-    warnings: List[str]
+    confidence: Confidence
+    warnings: Tuple[str, ...]
     refused: bool
     refusal_reason: Optional[str] = None
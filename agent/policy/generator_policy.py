@@ -0,0 +1,162 @@
+# agent/policy/generator_policy.py
+
+"""
+Generator Safety Policy
+=======================
+
+Authoritative refusal and safety rules for Dockerfile generation.
+
+This module:
+- Is deterministic
+- Never calls LLMs
+- Never guesses
+- Produces explicit refusal reasons
+"""
+
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from agent.analyzer.confidence import Confidence
+
+
+class Reason(IntEnum):
+    """
+    Refusal reason codes. Each code is one bit in a reasons mask;
+    declaration order is the order reasons are reported in.
+    """
+
+    NOT_PYTHON = 0
+    STACK_CONFIDENCE = 1
+    DEPENDENCIES_UNKNOWN = 2
+    FRAMEWORK_CONFIDENCE = 3
+    FRAMEWORK_MISSING = 4
+    INTERFACE_MISSING = 5
+    ENTRYPOINT_CONFIDENCE = 6
+    COMMAND_MISSING = 7
+    ANSWERS_MISSING = 8
+    ANSWER_EMPTY = 9
+
+
+_REASON_TEXT: Dict[int, str] = {
+    Reason.NOT_PYTHON: "Repository is not a confirmed Python project.",
+    Reason.STACK_CONFIDENCE: "Python stack confidence is not high.",
+    Reason.DEPENDENCIES_UNKNOWN: "Python dependency management is unknown.",
+    Reason.FRAMEWORK_CONFIDENCE: "Framework detection confidence is not high.",
+    Reason.FRAMEWORK_MISSING: "Application framework is not detected.",
+    Reason.INTERFACE_MISSING: "Application interface (ASGI/WSGI) is not detected.",
+    Reason.ENTRYPOINT_CONFIDENCE: "Entrypoint resolution confidence is not high.",
+    Reason.COMMAND_MISSING: "Entrypoint command is missing.",
+    Reason.ANSWERS_MISSING: "Clarification answers missing.",
+}
+
+
+def reasons_to_strings(
+    mask: int,
+    answered_questions: Optional[Mapping[str, str]] = None,
+) -> List[str]:
+    """
+    Expand a reasons mask into user-facing messages.
+
+    Only needed when surfacing a refusal; callers that just check
+    `allowed` never pay for the strings.
+
+    Args:
+        mask (int): Reasons mask from evaluate_generation_safety
+        answered_questions (Mapping, optional): Needed to name the
+            unanswered clarifications behind Reason.ANSWER_EMPTY
+    """
+    reasons: List[str] = []
+    for reason in Reason:
+        if not mask & (1 << reason):
+            continue
+        if reason is Reason.ANSWER_EMPTY:
+            for key, value in (answered_questions or {}).items():
+                if not value:
+                    reasons.append(f"Clarification '{key}' has no answer.")
+        else:
+            reasons.append(_REASON_TEXT[reason])
+    return reasons
+
+
+# Policy rules 1-4 in evaluation order: (section, key, check, reason)
+#   "present": the value must be truthy
+#   "high":    the value must be Confidence.HIGH or its "high" label
+_RULES: Tuple[Tuple[str, str, str, Reason], ...] = (
+    # 1. Python project certainty
+    ("python_stack", "is_python_project", "present", Reason.NOT_PYTHON),
+    ("python_stack", "confidence", "high", Reason.STACK_CONFIDENCE),
+    # 2. Dependency management must be known
+    ("python_stack", "dependency_management", "present", Reason.DEPENDENCIES_UNKNOWN),
+    # 3. Framework certainty
+    ("framework", "confidence", "high", Reason.FRAMEWORK_CONFIDENCE),
+    ("framework", "framework", "present", Reason.FRAMEWORK_MISSING),
+    ("framework", "interface", "present", Reason.INTERFACE_MISSING),
+    # 4. Entrypoint certainty
+    ("entrypoint", "confidence", "high", Reason.ENTRYPOINT_CONFIDENCE),
+    ("entrypoint", "command", "present", Reason.COMMAND_MISSING),
+)
+
+
+_Evaluator = Callable[[Mapping[str, object], Optional[Mapping[str, str]]], int]
+
+
+def _build_evaluator() -> _Evaluator:
+    """
+    Generate the policy evaluator from _RULES.
+
+    Keys, Confidence.HIGH and reason bits are emitted as literals, so
+    the generated function is a flat run of lookups and compares.
+    Identifier-like string constants are interned by the compiler,
+    and so are the analyzers' literal keys, so every lookup takes
+    CPython's identity fast path without explicit sys.intern().
+    PRIVATE helper.
+    """
+    sections = list(dict.fromkeys(section for section, _, _, _ in _RULES))
+    lines = ["def _eval_fast(a, q):"]
+    lines += [f"    s{i} = a.get({name!r}, _EMPTY)" for i, name in enumerate(sections)]
+    lines.append("    mask = 0")
+
+    for section, key, check, reason in _RULES:
+        var = f"s{sections.index(section)}"
+        if check == "present":
+            test = f"not {var}.get({key!r})"
+        else:
+            # Tuple membership compares with ==, so both the member
+            # and its serialized label are accepted without hashing
+            high = (int(Confidence.HIGH), str(Confidence.HIGH))
+            test = f"{var}.get({key!r}) not in {high!r}"
+        lines.append(f"    if {test}:")
+        lines.append(f"        mask |= {1 << reason}")
+
+    # 5. Clarification completeness / 6. No conflicting answers
+    lines += [
+        "    if q is None:",
+        f"        mask |= {1 << Reason.ANSWERS_MISSING}",
+        "    elif q and not all(q.values()):",
+        f"        mask |= {1 << Reason.ANSWER_EMPTY}",
+        "    return mask",
+    ]
+
+    namespace: Dict[str, object] = {"_EMPTY": MappingProxyType({})}
+    exec(compile("\n".join(lines), "<generator-policy>", "exec"), namespace)
+    return namespace["_eval_fast"]
+
+
+_eval_fast = _build_evaluator()
+
+
+def evaluate_generation_safety(
+    analyzer_output: Mapping[str, object],
+    answered_questions: Optional[Mapping[str, str]],
+) -> Tuple[bool, int]:
+    """
+    Evaluate whether Dockerfile generation is SAFE.
+
+    Returns:
+        (allowed, mask): mask has one bit per Reason; it is non-zero
+        exactly when allowed is False. Use reasons_to_strings() to
+        explain a refusal.
+    """
+    mask = _eval_fast(analyzer_output, answered_questions)
+    return mask == 0, mask
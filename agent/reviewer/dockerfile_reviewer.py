@@ -6,31 +6,105 @@ Performs static analysis on generated Dockerfiles
 using deterministic best-practice rules.
 """
 
-from typing import Dict, List
+import copy
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Union
 
 from agent.reviewer.rules import (
     review_base_image,
     review_user_security,
     review_dependency_installation,
     review_entrypoint,
+    scan_tokens,
 )
 
 
+REVIEW_CACHE_SIZE = 256
+
+
 class DockerfileReviewer:
     """
     Deterministic Dockerfile reviewer.
     """
 
-    def review(self, dockerfile: str) -> Dict[str, object]:
+    def __init__(self) -> None:
+        # content hash -> review result; guarded for review_many threads
+        self._cache: "OrderedDict[bytes, Dict[str, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def review(self, dockerfile: Union[str, bytes]) -> Dict[str, object]:
         """
         Review Dockerfile content and return issues.
+
+        Accepts text or raw bytes (e.g. read straight from disk);
+        rules run on bytes, so bytes input is never decoded.
+
+        Results are cached by content hash, so re-reviewing an
+        unchanged Dockerfile skips the rules. Callers always receive
+        their own copy.
+        """
+        if isinstance(dockerfile, str):
+            dockerfile = dockerfile.encode()
+
+        key = hashlib.blake2b(dockerfile, digest_size=16).digest()
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return copy.deepcopy(cached)
+
+        result = self._review(dockerfile)
+
+        with self._lock:
+            self._cache[key] = result
+            if len(self._cache) > REVIEW_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        return copy.deepcopy(result)
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached review results.
+        """
+        with self._lock:
+            self._cache.clear()
+
+    def review_many(
+        self, dockerfiles: List[Union[str, bytes]]
+    ) -> List[Dict[str, object]]:
+        """
+        Review a batch of Dockerfiles (CI / registry scan mode).
+
+        Results are returned in input order. Rules share only
+        immutable module-level state; the result cache is locked.
+        """
+        if len(dockerfiles) <= 1:
+            return [self.review(d) for d in dockerfiles]
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            return list(pool.map(self.review, dockerfiles))
+
+    # -------------------------
+    # Internal helpers
+    # -------------------------
+
+    def _review(self, dockerfile: bytes) -> Dict[str, object]:
+        """
+        Run every rule against the Dockerfile. Uncached.
         """
         issues: List[Dict[str, str]] = []
 
-        issues.extend(review_base_image(dockerfile))
-        issues.extend(review_user_security(dockerfile))
-        issues.extend(review_dependency_installation(dockerfile))
-        issues.extend(review_entrypoint(dockerfile))
+        hits = scan_tokens(dockerfile)
+
+        issues.extend(review_base_image(hits))
+        issues.extend(review_user_security(hits))
+        issues.extend(review_dependency_installation(hits))
+        issues.extend(review_entrypoint(hits))
 
         summary = {
             "errors": [i for i in issues if i["level"] == "error"],
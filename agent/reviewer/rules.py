@@ -4,21 +4,62 @@ Dockerfile Review Rules
 
 Defines static best-practice rules for Dockerfile review.
 Rules are deterministic and versioned.
-"""
-
-from typing import Dict, List
 
+The Dockerfile is scanned once, as bytes, for every token any rule
+needs (see scan_tokens); rules are predicates over the resulting hit
+set.
+"""
 
-def review_base_image(dockerfile: str) -> List[Dict[str, str]]:
+import re
+from typing import Dict, FrozenSet, List
+
+
+# Rule token name -> literal bytes searched for
+RULE_TOKENS: Dict[str, bytes] = {
+    "from_python": b"FROM python",
+    "slim": b"slim",
+    "latest": b":latest",
+    "user": b"USER",
+    "pip_install": b"pip install",
+    "no_cache_dir": b"--no-cache-dir",
+    "requirements": b"requirements.txt",
+    "copy_requirements": b"COPY requirements.txt",
+    "cmd": b"CMD",
+    "entrypoint": b"ENTRYPOINT",
+}
+
+# One named group per token; match.lastgroup names the token found.
+# The zero-width lookahead reports a token at every offset, so
+# overlapping tokens (e.g. "COPY requirements.txt" / "requirements.txt")
+# behave exactly like independent substring checks
+_TOKEN_RE = re.compile(
+    b"(?="
+    + b"|".join(
+        b"(?P<" + name.encode() + b">" + re.escape(token) + b")"
+        for name, token in RULE_TOKENS.items()
+    )
+    + b")"
+)
+
+
+def scan_tokens(dockerfile: bytes) -> FrozenSet[str]:
+    """
+    Single pass over the Dockerfile bytes. Returns the names of the
+    rule tokens present.
+    """
+    return frozenset(m.lastgroup for m in _TOKEN_RE.finditer(dockerfile))
+
+
+def review_base_image(hits: FrozenSet[str]) -> List[Dict[str, str]]:
     issues = []
 
-    if "FROM python" in dockerfile and "slim" not in dockerfile:
+    if "from_python" in hits and "slim" not in hits:
         issues.append({
             "level": "warning",
             "message": "Base image is not slim. Consider using python:X.Y-slim for smaller image size."
         })
 
-    if ":latest" in dockerfile:
+    if "latest" in hits:
         issues.append({
             "level": "warning",
             "message": "Avoid using 'latest' tag for base images. Pin a specific version."
@@ -27,10 +68,10 @@ def review_base_image(dockerfile: str) -> List[Dict[str, str]]:
     return issues
 
 
-def review_user_security(dockerfile: str) -> List[Dict[str, str]]:
+def review_user_security(hits: FrozenSet[str]) -> List[Dict[str, str]]:
     issues = []
 
-    if "USER" not in dockerfile:
+    if "user" not in hits:
         issues.append({
             "level": "warning",
             "message": "Container runs as root. Consider adding a non-root USER for security."
@@ -39,16 +80,16 @@ def review_user_security(dockerfile: str) -> List[Dict[str, str]]:
     return issues
 
 
-def review_dependency_installation(dockerfile: str) -> List[Dict[str, str]]:
+def review_dependency_installation(hits: FrozenSet[str]) -> List[Dict[str, str]]:
     issues = []
 
-    if "pip install" in dockerfile and "--no-cache-dir" not in dockerfile:
+    if "pip_install" in hits and "no_cache_dir" not in hits:
         issues.append({
             "level": "warning",
             "message": "pip install should use --no-cache-dir to reduce image size."
         })
 
-    if "requirements.txt" in dockerfile and "COPY requirements.txt" not in dockerfile:
+    if "requirements" in hits and "copy_requirements" not in hits:
         issues.append({
             "level": "error",
             "message": "requirements.txt is referenced but not copied explicitly before installation."
@@ -57,10 +98,10 @@ def review_dependency_installation(dockerfile: str) -> List[Dict[str, str]]:
     return issues
 
 
-def review_entrypoint(dockerfile: str) -> List[Dict[str, str]]:
+def review_entrypoint(hits: FrozenSet[str]) -> List[Dict[str, str]]:
     issues = []
 
-    if "CMD" not in dockerfile and "ENTRYPOINT" not in dockerfile:
+    if "cmd" not in hits and "entrypoint" not in hits:
         issues.append({
             "level": "error",
             "message": "No CMD or ENTRYPOINT found. Container will not start."
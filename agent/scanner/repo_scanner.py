@@ -7,12 +7,15 @@ Collects structural facts from a repository while
 explicitly excluding irrelevant and dangerous paths.
 """
 
+import hashlib
+import os
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Counter as CounterT, Dict, FrozenSet, List, NamedTuple, Tuple
 
 
-IGNORED_DIRS: Set[str] = {
-     ".git",
+IGNORED_DIRS: FrozenSet[str] = frozenset({
+    ".git",
     "__pycache__",
     ".venv",
     "venv",
@@ -20,23 +23,119 @@ IGNORED_DIRS: Set[str] = {
     ".idea",
     ".vscode",
     ".ruff_cache",
-}
+})
 
 
-IGNORED_EXTENSIONS: Set[str] = {
+IGNORED_EXTENSIONS: FrozenSet[str] = frozenset({
     ".pyc",
     ".log",
-}
+})
 
 
-CONFIG_FILE_NAMES: Set[str] = {
+# Derived keys for analyzers; not part of the printable report
+INDEX_KEYS: FrozenSet[str] = frozenset({
+    "files_set",
+    "py_files",
+    "fingerprint",
+})
+
+
+CONFIG_FILE_NAMES: FrozenSet[str] = frozenset({
     "requirements.txt",
     "pyproject.toml",
     "package.json",
     "Dockerfile",
     "docker-compose.yml",
     ".env",
-}
+})
+
+
+class _ScanPart(NamedTuple):
+    """
+    Facts collected while walking the tree.
+    """
+
+    files: List[str]
+    extensions: CounterT[str]
+    config_files: List[str]
+    stamps: List[Tuple[str, int, int]]
+
+
+def _new_part() -> _ScanPart:
+    return _ScanPart([], Counter(), [], [])
+
+
+def _scan_dir(
+    path: str, prefix_len: int, part: _ScanPart, subdirs: List[str]
+) -> None:
+    """
+    Record the files of a single directory into `part` and queue its
+    non-ignored subdirectories onto `subdirs`.
+    PRIVATE helper.
+    """
+    files, extensions, config_files, stamps = part
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+
+            if entry.is_dir(follow_symlinks=False):
+                if name not in IGNORED_DIRS:
+                    subdirs.append(entry.path)
+                continue
+
+            if not entry.is_file():
+                continue
+
+            suffix = _suffix(name)
+            if suffix in IGNORED_EXTENSIONS:
+                continue
+
+            relative_path = entry.path[prefix_len:]
+            files.append(relative_path)
+
+            if suffix:
+                extensions[suffix] += 1
+
+            is_config = name in CONFIG_FILE_NAMES
+            if is_config:
+                config_files.append(relative_path)
+
+            if suffix == ".py" or is_config:
+                stat = entry.stat()
+                stamps.append((relative_path, stat.st_mtime_ns, stat.st_size))
+
+
+def _walk(path: str, prefix_len: int) -> _ScanPart:
+    """
+    Scan a whole tree with an explicit stack.
+    """
+    part = _new_part()
+    stack = [path]
+    while stack:
+        _scan_dir(stack.pop(), prefix_len, part, stack)
+    return part
+
+
+def _fingerprint(entries: List[Tuple[str, int, int]]) -> str:
+    """
+    Content fingerprint over (path, mtime_ns, size) of analyzed files.
+    Not security-sensitive; only used as a cache key.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path, mtime_ns, size in sorted(entries):
+        digest.update(f"{path}\0{mtime_ns}\0{size}\n".encode())
+    return digest.hexdigest()
+
+
+def _suffix(name: str) -> str:
+    """
+    Same result as Path(name).suffix, without building a Path.
+    """
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[dot:]
+    return ""
 
 
 def scan_repository(repo_path: Path) -> Dict[str, object]:
@@ -47,37 +146,65 @@ def scan_repository(repo_path: Path) -> Dict[str, object]:
         repo_path (Path): Validated repository path
 
     Returns:
-        Dict[str, object]: Structured repository metadata
+        Dict[str, object]: Structured repository metadata.
+        Besides the sorted file list, derived keys are included so
+        analyzers never re-filter or linearly search it:
+        - files_set: frozenset of all files (O(1) membership)
+        - py_files: tuple of Python source files
+        - fingerprint: changes whenever a Python or config file is
+          added, removed, or modified
+        file_extensions is a Counter, keyed in sorted order.
     """
-    files: List[str] = []
-    extensions: Dict[str, int] = {}
-    config_files: List[str] = []
-
-    def walk(directory: Path):
-        for item in directory.iterdir():
-            if item.is_dir():
-                if item.name in IGNORED_DIRS:
-                    continue
-                walk(item)
-            elif item.is_file():
-                if item.suffix in IGNORED_EXTENSIONS:
-                    continue
-
-                relative_path = str(item.relative_to(repo_path))
-                files.append(relative_path)
+    root = str(repo_path)
+    prefix_len = len(root) + 1
 
-                if item.suffix:
-                    extensions[item.suffix] = extensions.get(item.suffix, 0) + 1
+    # A single serial walk: scandir is fast enough that a process
+    # pool only adds startup cost (and forks from library code)
+    files, extensions, config_files, stamps = _walk(root, prefix_len)
 
-                if item.name in CONFIG_FILE_NAMES:
-                    config_files.append(relative_path)
-
-    walk(repo_path)
+    # Sort in place: no second copy of a potentially huge list
+    files.sort()
+    config_files.sort()
 
     return {
         "total_files": len(files),
-        "files": sorted(files),
-        "file_extensions": dict(sorted(extensions.items())),
-        "config_files": sorted(config_files),
+        "files": files,
+        "files_set": frozenset(files),
+        "py_files": tuple(f for f in files if f.endswith(".py")),
+        # Counter (a dict) in sorted key order: deterministic output,
+        # and .most_common() stays available to consumers
+        "file_extensions": Counter(dict(sorted(extensions.items()))),
+        "config_files": config_files,
+        "fingerprint": _fingerprint(stamps),
     }
 
+
+def public_scan(scan_data: Dict[str, object]) -> Dict[str, object]:
+    """
+    Scan output without the derived INDEX_KEYS: what reports, state
+    and API responses expose (all values JSON-serializable).
+    """
+    return {k: v for k, v in scan_data.items() if k not in INDEX_KEYS}
+
+
+def file_indexes(
+    scan_data: Dict[str, object],
+) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """
+    Return (files_set, py_files) for a scan.
+
+    Falls back to deriving both from "files" when the scan dict lacks
+    the indexes (e.g. it was built by hand or came through
+    public_scan()).
+    """
+    files_set = scan_data.get("files_set")
+    py_files = scan_data.get("py_files")
+
+    if files_set is None or py_files is None:
+        files: List[str] = scan_data.get("files", [])
+        if files_set is None:
+            files_set = frozenset(files)
+        if py_files is None:
+            py_files = tuple(f for f in files if f.endswith(".py"))
+
+    return files_set, py_files
@@ -16,7 +16,9 @@ import json
 from pathlib import Path
 from typing import NoReturn
 
-from agent.scanner.repo_scanner import scan_repository
+from agent.scanner.repo_scanner import public_scan, scan_repository
+from agent.analyzer._ast_cache import parse_python_files
+from agent.analyzer.confidence import to_labels
 from agent.analyzer.stack_detector import detect_python_stack
 from agent.analyzer.framework_detector import detect_framework
 from agent.analyzer.entrypoint_resolver import resolve_entrypoint
@@ -67,7 +69,9 @@ def run_analysis(repo_path: Path) -> NoReturn:
     scan_data = scan_repository(repo_path)
     print("[INFO] Repository scan completed")
 
-    stack_analysis = detect_python_stack(repo_path, scan_data)
+    parsed_asts = parse_python_files(repo_path, scan_data["py_files"])
+
+    stack_analysis = detect_python_stack(repo_path, scan_data, parsed_asts)
     print("[INFO] Python stack analysis completed")
 
     framework_analysis = detect_framework(
@@ -82,20 +86,18 @@ def run_analysis(repo_path: Path) -> NoReturn:
         scan_data=scan_data,
         framework_data=framework_analysis,
         stack_data=stack_analysis,
+        parsed_asts=parsed_asts,
     )
     print("[INFO] Entrypoint resolution completed")
 
-    print(
-        json.dumps(
-            {
-                "repository": scan_data,
-                "python_stack": stack_analysis,
-                "framework": framework_analysis,
-                "entrypoint": entrypoint,
-            },
-            indent=2,
-        )
-    )
+    report = {
+        "repository": public_scan(scan_data),
+        "python_stack": stack_analysis,
+        "framework": framework_analysis,
+        "entrypoint": entrypoint,
+    }
+
+    print(json.dumps(to_labels(report), indent=2))
 
     sys.exit(0)
 